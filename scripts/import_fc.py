@@ -11,12 +11,18 @@ Usage (Beispiel):
 
 import argparse
 import json
+import os
 import socket
 import sys
 import time
-from typing import Optional, Tuple, Dict, Any, List, Union, TextIO
+from typing import Optional, Tuple, Dict, Any, Union, TextIO
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster encode/decode, works on bytes directly
+except ImportError:
+    orjson = None
+
 # ----------------------------- CLI -----------------------------------------
 
 def parse_args() -> argparse.Namespace:
@@ -44,8 +50,17 @@ def parse_args() -> argparse.Namespace:
 
 # ----------------------------- Util -----------------------------------------
 
+_ts_sec = -1
+_ts_str = ""
+
 def ts() -> str:
-    return time.strftime("%H:%M:%S")
+    # strftime only when the wall-clock second changes (progress/log lines come in bursts)
+    global _ts_sec, _ts_str
+    now = int(time.time())
+    if now != _ts_sec:
+        _ts_sec = now
+        _ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_str
 
 class Color:
     def __init__(self, enabled: bool):
@@ -73,15 +88,44 @@ def log_dbg(msg: str, logf: Optional[TextIO]):
 
 # ----------------------- JSON helpers (robust fields) -----------------------
 
-def try_paths(obj: Dict[str, Any], paths: List[str]) -> Optional[Any]:
+if orjson is not None:
+    def json_dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def json_loads_line(raw: bytes) -> Any:
+        return orjson.loads(raw)
+else:
+    # json.dumps() with non-default options builds a new encoder per call; keep one
+    _encode_compact = json.JSONEncoder(separators=(",", ":")).encode
+
+    def json_dumps_line(obj: Any) -> bytes:
+        return _encode_compact(obj).encode("utf-8")
+
+    def json_loads_line(raw: bytes) -> Any:
+        return json.loads(raw.decode("utf-8", "replace"))
+
+KeyPath = Tuple[str, ...]
+
+def compile_paths(*paths: str) -> Tuple[KeyPath, ...]:
+    """Split dotted paths like 'result.data.state' once, for use with try_paths()."""
+    return tuple(tuple(p.split(".")) for p in paths)
+
+# Reply fields probed on every status poll (pre-split at import time)
+PATHS_JOB_ID   = compile_paths("result.data.jobId", "result.jobId")
+PATHS_STATE    = compile_paths("result.data.state", "result.state")
+PATHS_PROGRESS = compile_paths("result.data.progress", "result.progress")
+PATHS_MESSAGE  = compile_paths("result.data.message", "result.message", "result.msg")
+PATHS_ERROR    = compile_paths("result.data.error", "result.error", "error.message")
+
+def try_paths(obj: Dict[str, Any], paths: Tuple[KeyPath, ...]) -> Optional[Any]:
     """
-    Try multiple dotted paths like 'result.data.state' against dict `obj`.
+    Try multiple key paths (see compile_paths) against dict `obj`.
     Returns the first found scalar or None.
     """
     for path in paths:
         cur: Any = obj
         ok = True
-        for key in path.split("."):
+        for key in path:
             if isinstance(cur, dict) and key in cur:
                 cur = cur[key]
             else:
@@ -102,6 +146,7 @@ class RpcClient:
         self.pretty = pretty
         self.logf = logf
         self.rpc_id = 1
+        self._rxbuf = bytearray()
 
     def set_start_id(self, i: int):
         self.rpc_id = i
@@ -110,6 +155,8 @@ class RpcClient:
         self.close()
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Small request lines followed by a blocking read: don't let Nagle hold them back
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         s.settimeout(10.0)
         s.connect((self.host, self.port))
         self.sock = s
@@ -126,46 +173,50 @@ class RpcClient:
             except Exception:
                 pass
         self.sock = None
+        self._rxbuf.clear()
 
-    def _send_line(self, line: str) -> None:
+    def _send_line(self, line: bytes) -> None:
+        """Send one complete, newline-terminated request line."""
         if not self.sock:
             raise RuntimeError("socket not connected")
-        if not line.endswith("\n"):
-            line = line + "\n"
         if self.debug and self.logf:
-            log_dbg(f">>> {line.strip()}", self.logf)
-        self.sock.sendall(line.encode("utf-8", "strict"))
+            log_dbg(f">>> {line.strip().decode('utf-8', 'replace')}", self.logf)
+        self.sock.sendall(line)
 
-    def _recv_line(self, timeout: float = 10.0) -> str:
+    def _recv_line(self, timeout: float = 10.0) -> bytes:
         if not self.sock:
             raise RuntimeError("socket not connected")
         self.sock.settimeout(timeout)
-        chunks: List[bytes] = []
+        # Read in blocks; bytes past the newline stay buffered for the next reply
         while True:
-            b = self.sock.recv(1)
-            if not b:
+            idx = self._rxbuf.find(b"\n")
+            if idx >= 0:
+                raw = bytes(self._rxbuf[:idx])
+                del self._rxbuf[:idx + 1]
                 break
-            if b == b"\n":
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raw = bytes(self._rxbuf)
+                self._rxbuf.clear()
                 break
-            chunks.append(b)
-        line = b"".join(chunks).decode("utf-8", "replace")
+            self._rxbuf += chunk
         if self.debug and self.logf:
-            log_dbg(f"<<< {line}", self.logf)
+            log_dbg(f"<<< {raw.decode('utf-8', 'replace')}", self.logf)
         if self.pretty and self.logf:
             try:
-                parsed = json.loads(line)
+                parsed = json_loads_line(raw)
                 self.logf.write(json.dumps(parsed, indent=2, ensure_ascii=False) + "\n")
                 self.logf.flush()
             except Exception:
                 pass
-        return line
+        return raw
 
     def call(self, method: str, params: Optional[dict] = None) -> Dict[str, Any]:
         req = {"jsonrpc": "2.0", "id": self.rpc_id, "method": method}
         self.rpc_id += 1
         if params is not None:
             req["params"] = params
-        line = json.dumps(req, separators=(",", ":"))
+        line = json_dumps_line(req) + b"\n"
 
         for attempt in (1, 2):
             try:
@@ -175,7 +226,7 @@ class RpcClient:
                 resp_line = self._recv_line(timeout=10.0)
                 if not resp_line:
                     raise RuntimeError("empty response (connection closed?)")
-                return json.loads(resp_line)
+                return json_loads_line(resp_line)
             except Exception as e:
                 self.close()
                 if attempt == 2:
@@ -201,6 +252,8 @@ class ProgressPrinter:
         self._last_state: Optional[str] = None
         self._last_t = 0.0
         self._is_tty = sys.stderr.isatty()
+        self._fd = sys.stderr.fileno()
+        self._clear = b"\r" + b" " * 100 + b"\r"
 
     def update(self, percent: Union[int, str], state: str, message: str):
         if self.quiet:
@@ -223,13 +276,14 @@ class ProgressPrinter:
         msg = f"{pct:3d}% {message}" if message else f"{pct:3d}%"
         line = f"[{ts()}] {self.color.B}{msg}{self.color.N}"
 
+        # One unbuffered write per update (clear + line), bypassing the TextIO layer
+        payload = line.encode("utf-8", "replace")
         if self._is_tty:
-            sys.stderr.write("\r" + " " * 100 + "\r")  # clear line
-            sys.stderr.write(line)
-            sys.stderr.flush()
+            payload = self._clear + payload
         else:
-            sys.stderr.write(line + "\n")
-            sys.stderr.flush()
+            payload += b"\n"
+        sys.stderr.flush()
+        os.write(self._fd, payload)
 
     def finish(self, ok: bool, tail: str = ""):
         if self.quiet:
@@ -277,7 +331,7 @@ def main():
         info(f"{color.R}Error: profile.importAs failed: {e}{color.N}")
         sys.exit(20)
 
-    job_id = try_paths(resp_start, ["result.data.jobId", "result.jobId"])
+    job_id = try_paths(resp_start, PATHS_JOB_ID)
     if not job_id:
         info(f"{color.R}Error: jobId missing in response of profile.importAs{color.N}")
         sys.exit(21)
@@ -286,23 +340,46 @@ def main():
     pp = ProgressPrinter(quiet=a.quiet, color=color, throttle_ms=max(100, a.progress_every_ms))
     state = "running"
 
-    interval = max(10, a.interval_ms) / 1000.0
+    # Adaptive cadence: back off (up to 1s) while the job reports no change,
+    # snap back to the base interval on progress and while finishing (>= 95%).
+    base_interval = max(10, a.interval_ms) / 1000.0
+    max_interval = max(1.0, base_interval)
+    interval = base_interval
+    last_seen: Optional[Tuple[str, Any]] = None
+    # No request pipelining: lfcd answers strictly in order, so a status request
+    # sent ahead of the sleep would only report a state one interval stale.
+    status_params = {"jobId": job_id}
     ok = False
     while True:
+        # Polls run on a fixed cadence measured from when each request goes out.
+        # The blocking read returns as soon as the reply is readable, so state
+        # changes are seen one RTT after the poll instead of one interval later.
+        poll_start = time.monotonic()
         try:
-            resp_stat = cli.call("profile.importStatus", {"jobId": job_id})
+            resp_stat = cli.call("profile.importStatus", status_params)
         except Exception as e:
             info(f"{color.R}Error: profile.importStatus failed: {e}{color.N}")
             pp.finish(False, "status failed")
             sys.exit(22)
 
-        state = (try_paths(resp_stat, ["result.data.state", "result.state"]) or "running").lower()
-        progress = try_paths(resp_stat, ["result.data.progress", "result.progress"]) or 0
-        message = try_paths(resp_stat, ["result.data.message", "result.message", "result.msg"]) or ""
-        error_msg = try_paths(resp_stat, ["result.data.error", "result.error", "error.message"]) or ""
+        state = (try_paths(resp_stat, PATHS_STATE) or "running").lower()
+        progress = try_paths(resp_stat, PATHS_PROGRESS) or 0
+        message = try_paths(resp_stat, PATHS_MESSAGE) or ""
+        error_msg = try_paths(resp_stat, PATHS_ERROR) or ""
 
         pp.update(progress, state, message)
 
+        seen = (state, progress)
+        try:
+            finishing = float(progress) >= 95
+        except (TypeError, ValueError):
+            finishing = False
+        if seen != last_seen or finishing:
+            interval = base_interval
+        else:
+            interval = min(interval * 2, max_interval)
+        last_seen = seen
+
         if state in ("done", "finished", "success"):
             ok = True
             break
@@ -314,7 +391,10 @@ def main():
             pp.finish(False, error_msg or message)
             sys.exit(23)
 
-        time.sleep(interval)
+        # Sleep only what is left of this interval (the RTT is already spent)
+        remaining = poll_start + interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
     pp.finish(True, "import finished")
 
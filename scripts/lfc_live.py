@@ -10,14 +10,24 @@ a compact human-readable snapshot. No legacy schema support.
 """
 
 import argparse
+import ctypes
+import io
 import json
+import mmap
 import os
+import select
 import shutil
 import signal
+import struct
 import sys
 import time
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+try:
+    import orjson  # optional: parses the mapped bytes without a decode step
+except ImportError:
+    orjson = None
 
 # ----------------------------- SHM I/O ---------------------------------------
 
@@ -26,23 +36,129 @@ def shm_file_from_name(name: str) -> str:
     base = name[1:] if name.startswith("/") else name
     return os.path.join("/dev/shm", base)
 
-def read_shm_json(shm_file: str) -> Optional[Dict[str, Any]]:
-    try:
-        with open(shm_file, "rb") as f:
-            data = f.read()
-        if not data:
+class ShmJsonReader:
+    """
+    Keeps the telemetry segment mapped between ticks.
+
+    lfcd recreates the segment on every publish (new inode), so the mapping is
+    refreshed whenever inode/size/mtime change; an unchanged segment returns
+    the previously parsed document without touching the data at all.
+    """
+
+    def __init__(self, shm_file: str):
+        self.shm_file = shm_file
+        self._fd: Optional[int] = None
+        self._mm: Optional[mmap.mmap] = None
+        self._sig: Optional[Tuple[int, int, int]] = None
+        self._doc: Optional[Dict[str, Any]] = None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._sig = None
+        self._doc = None
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        try:
+            st = os.stat(self.shm_file)
+            sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+            if sig == self._sig and self._doc is not None:
+                return self._doc
+            if self._sig is None or sig[0] != self._sig[0] or sig[1] != self._sig[1]:
+                self.close()
+                if st.st_size == 0:
+                    return None
+                self._fd = os.open(self.shm_file, os.O_RDONLY | os.O_CLOEXEC)
+                self._mm = mmap.mmap(self._fd, 0, prot=mmap.PROT_READ)
+            self._sig = sig
+            data = self._mm[:] if self._mm is not None else b""
+            if not data:
+                return None
+            if orjson is not None:
+                doc = orjson.loads(data)
+            else:
+                doc = json.loads(data.decode("utf-8", errors="ignore"))
+            self._doc = doc if isinstance(doc, dict) else None
+            return doc
+        except Exception:
+            self.close()
             return None
-        return json.loads(data.decode("utf-8", errors="ignore"))
-    except Exception:
-        return None
+
+# ----------------------------- change notification ---------------------------
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO    = 0x00000080
+_IN_EVENT = struct.Struct("iIII")   # wd, mask, cookie, len (+ name[len])
+
+class ShmWatcher:
+    """
+    inotify watch for the telemetry segment. lfcd recreates the file on every
+    publish (and the /dev/shm fallback renames over it), so the directory is
+    watched and events are filtered by name. Only completed publishes count:
+    the writer's close (IN_CLOSE_WRITE) or the fallback's rename (IN_MOVED_TO);
+    create/ftruncate/partial writes would expose an empty or half-written
+    segment. fd stays -1 if inotify is not available; callers then fall back
+    to polling.
+    """
+
+    def __init__(self, shm_file: str):
+        self.name = os.fsencode(os.path.basename(shm_file))
+        self.fd = -1
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            mask = IN_CLOSE_WRITE | IN_MOVED_TO
+            if libc.inotify_add_watch(fd, os.fsencode(os.path.dirname(shm_file)), mask) < 0:
+                os.close(fd)
+                return
+            self.fd = fd
+        except (OSError, AttributeError):
+            self.fd = -1
+
+    def drain(self) -> bool:
+        """Consume all pending events; True if any of them was for our file."""
+        hit = False
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            off = 0
+            while off + _IN_EVENT.size <= len(buf):
+                _wd, _mask, _cookie, ln = _IN_EVENT.unpack_from(buf, off)
+                off += _IN_EVENT.size
+                if buf[off:off + ln].rstrip(b"\0") == self.name:
+                    hit = True
+                off += ln
+        return hit
 
 # ----------------------------- formatting ------------------------------------
 
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+_cols: Optional[int] = None
+
 def tcols(default: int = 120) -> int:
-    try:
-        return shutil.get_terminal_size((default, 24)).columns
-    except Exception:
-        return default
+    # Queried once and cached; SIGWINCH (see main) drops the cache on resize
+    global _cols
+    if _cols is None:
+        try:
+            _cols = shutil.get_terminal_size((default, 24)).columns
+        except Exception:
+            _cols = default
+    return _cols
+
+def invalidate_tcols() -> None:
+    global _cols
+    _cols = None
 
 def ell(s: str, w: int) -> str:
     s = s or ""
@@ -101,55 +217,9 @@ def extract_profile(doc: Dict[str, Any]) -> Dict[str, Any]:
         "curveCount": p.get("curveCount"),
     }
 
-def extract_chips(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    return [c for c in (doc.get("chips") or []) if isinstance(c, dict)]
-
-def extract_temps(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    out = []
-    for t in (doc.get("temps") or []):
-        if not isinstance(t, dict):
-            continue
-        out.append({
-            "chipPath": t.get("chipPath") or "",
-            "inputPath": t.get("inputPath") or "",
-            "label": t.get("label") or "",
-            "valueC": t.get("valueC"),
-        })
-    return out
-
-def extract_fans(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    out = []
-    for f in (doc.get("fans") or []):
-        if not isinstance(f, dict):
-            continue
-        out.append({
-            "chipPath": f.get("chipPath") or "",
-            "inputPath": f.get("inputPath") or "",
-            "label": f.get("label") or "",
-            "rpm": f.get("rpm"),
-        })
-    return out
-
-def extract_pwms(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    out = []
-    for p in (doc.get("pwms") or []):
-        if not isinstance(p, dict):
-            continue
-        out.append({
-            "chipPath":   p.get("chipPath") or "",
-            "pwmPath":    p.get("pwmPath") or "",
-            "enablePath": p.get("enablePath") or "",
-            "pwmMax":     p.get("pwmMax"),
-            "enable":     p.get("enable"),
-            "raw":        p.get("raw"),
-            "percent":    p.get("percent"),
-            "fanRpm":     p.get("fanRpm"),
-            "label":      p.get("label") or "",
-        })
-    return out
-
-def extract_gpus(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
-    return [g for g in (doc.get("gpus") or []) if isinstance(g, dict)]
+def dict_rows(doc: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    """Entries of doc[key] as-is (renderers read fields directly, no per-row copies)."""
+    return [r for r in (doc.get(key) or []) if isinstance(r, dict)]
 
 
 # ----------------------------- profile label mapping -------------------------
@@ -214,104 +284,125 @@ def profile_label_for_pwm(doc: dict, pwm_path: str) -> str:
 
 # ----------------------------- rendering -------------------------------------
 
-def render_header(doc: Dict[str, Any]) -> None:
+def render_header(doc: Dict[str, Any], out: TextIO) -> None:
     cols = tcols()
     version, enabled = extract_header(doc)
     prof = extract_profile(doc)
-    print("\n" + "=" * cols)
-    print(f"LinuxFanControl Telemetry  |  version={version}  |  engine={'ENABLED' if enabled else 'disabled'}")
+    print("\n" + "=" * cols, file=out)
+    print(f"LinuxFanControl Telemetry  |  version={version}  |  engine={'ENABLED' if enabled else 'disabled'}", file=out)
     if prof["name"]:
         print(f"Active profile: {prof['name']} "
-              f"(controls={prof['controlCount']}, curves={prof['curveCount']})")
-    print("-" * cols)
-
-def render_gpus(doc: Dict[str, Any]) -> None:
-    rows = extract_gpus(doc)
+              f"(controls={prof['controlCount']}, curves={prof['curveCount']})", file=out)
+    print("-" * cols, file=out)
+
+# Column widths, static header/rule lines and row templates are built once at
+# import; per tick only the row values get formatted.
+
+W_G_VEND, W_G_IDX, W_G_PCI, W_G_DRM, W_G_CAP, W_G_RPM, W_G_T = 8, 3, 12, 12, 7, 7, 8
+_HDR_GPUS = ("  " + f"{'Vendor':<{W_G_VEND}} | {'#':>{W_G_IDX}} | {'PCI':<{W_G_PCI}} | {'DRM':<{W_G_DRM}} | "
+             f"{'Fan':<{W_G_CAP}} | {'RPM':>{W_G_RPM}} | {'Edge °C':>{W_G_T}} | {'Hotspot °C':>{W_G_T}} | "
+             f"{'Mem °C':>{W_G_T}} | Hwmon")
+_RULE_GPUS = rule([W_G_VEND, W_G_IDX, W_G_PCI, W_G_DRM, W_G_CAP, W_G_RPM, W_G_T, W_G_T, W_G_T, 10])
+_ROW_GPUS = (f"  {{vend:<{W_G_VEND}}} | {{idx:>{W_G_IDX}}} | {{pci:<{W_G_PCI}}} | {{drm:<{W_G_DRM}}} | "
+             f"{{cap:<{W_G_CAP}}} | {{rpm:>{W_G_RPM}}} | {{tE:>{W_G_T}}} | {{tH:>{W_G_T}}} | "
+             f"{{tM:>{W_G_T}}} | {{hw}}").format
+
+W_T_CHIP, W_T_LBL, W_T_VAL = 14, 24, 8
+_HDR_TEMPS = "  " + f"{'Chip':<{W_T_CHIP}} | {'Label':<{W_T_LBL}} | {'Value °C':>{W_T_VAL}} | Path"
+_RULE_TEMPS = rule([W_T_CHIP, W_T_LBL, W_T_VAL, 10])
+_ROW_TEMPS = f"  {{chip:<{W_T_CHIP}}} | {{lbl:<{W_T_LBL}}} | {{val:>{W_T_VAL}}} | {{path}}".format
+
+W_F_CHIP, W_F_LBL, W_F_RPM = 14, 24, 7
+_HDR_FANS = "  " + f"{'Chip':<{W_F_CHIP}} | {'Label':<{W_F_LBL}} | {'RPM':>{W_F_RPM}} | Path"
+_RULE_FANS = rule([W_F_CHIP, W_F_LBL, W_F_RPM, 10])
+_ROW_FANS = f"  {{chip:<{W_F_CHIP}}} | {{lbl:<{W_F_LBL}}} | {{rpm:>{W_F_RPM}}} | {{path}}".format
+
+W_P_CHIP, W_P_LABEL, W_P_PCT, W_P_VAL, W_P_MODE, W_P_RPM = 14, 22, 7, 13, 6, 7
+_HDR_PWMS = ("  " + f"{'Chip':<{W_P_CHIP}} | {'Label':<{W_P_LABEL}} | {'Percent':>{W_P_PCT}} | "
+             f"{'Value/Max':<{W_P_VAL}} | {'Mode':<{W_P_MODE}} | {'RPM':>{W_P_RPM}} | PWM Path")
+_RULE_PWMS = rule([W_P_CHIP, W_P_LABEL, W_P_PCT, W_P_VAL, W_P_MODE, W_P_RPM, 10])
+_ROW_PWMS = (f"  {{chip:<{W_P_CHIP}}} | {{label:<{W_P_LABEL}}} | {{pct:>{W_P_PCT}}} | "
+             f"{{v_m:<{W_P_VAL}}} | {{mode:<{W_P_MODE}}} | {{rpm:>{W_P_RPM}}} | {{path}}").format
+
+def render_gpus(doc: Dict[str, Any], out: TextIO) -> None:
+    rows = dict_rows(doc, "gpus")
     if not rows:
         return
-    W_VEND, W_IDX, W_PCI, W_DRM, W_CAP, W_RPM, W_T = 8, 3, 12, 12, 7, 7, 8
-    print("GPUs:")
-    print("  " + f"{'Vendor':<{W_VEND}} | {'#':>{W_IDX}} | {'PCI':<{W_PCI}} | {'DRM':<{W_DRM}} | "
-          f"{'Fan':<{W_CAP}} | {'RPM':>{W_RPM}} | {'Edge °C':>{W_T}} | {'Hotspot °C':>{W_T}} | {'Mem °C':>{W_T}} | Hwmon")
-    print(rule([W_VEND, W_IDX, W_PCI, W_DRM, W_CAP, W_RPM, W_T, W_T, W_T, 10]))
+    print("GPUs:", file=out)
+    print(_HDR_GPUS, file=out)
+    print(_RULE_GPUS, file=out)
     for g in rows:
-        vend = (g.get("vendor") or "")[:W_VEND]
-        idx  = g.get("index")
-        pci  = g.get("pci") or ""
-        drm  = g.get("drm") or ""
         cap  = ("tach" if g.get("hasFanTach") else "-") + "/" + ("pwm" if g.get("hasFanPwm") else "-")
-        rpm  = g.get("fanRpm")
-        tE   = g.get("tempEdgeC")
-        tH   = g.get("tempHotspotC")
-        tM   = g.get("tempMemoryC")
-        hw   = g.get("hwmon") or ""
-        print("  " + f"{vend:<{W_VEND}} | {idx:>{W_IDX}} | {ell(pci, W_PCI):<{W_PCI}} | "
-              f"{ell(drm, W_DRM):<{W_DRM}} | {cap:<{W_CAP}} | {fmt_i(rpm):>{W_RPM}} | "
-              f"{fmt_f(tE):>{W_T}} | {fmt_f(tH):>{W_T}} | {fmt_f(tM):>{W_T}} | {hw}")
-
-def render_chips(doc: Dict[str, Any]) -> None:
-    chips = extract_chips(doc)
+        print(_ROW_GPUS(vend=(g.get("vendor") or "")[:W_G_VEND], idx=g.get("index"),
+                        pci=ell(g.get("pci") or "", W_G_PCI), drm=ell(g.get("drm") or "", W_G_DRM),
+                        cap=cap, rpm=fmt_i(g.get("fanRpm")),
+                        tE=fmt_f(g.get("tempEdgeC")), tH=fmt_f(g.get("tempHotspotC")),
+                        tM=fmt_f(g.get("tempMemoryC")), hw=g.get("hwmon") or ""), file=out)
+
+def render_chips(doc: Dict[str, Any], out: TextIO) -> None:
+    chips = dict_rows(doc, "chips")
     if not chips:
         return
-    print("\nHWMON Chips:")
+    print("\nHWMON Chips:", file=out)
     for c in chips:
         name = c.get("name") or ""
         vendor = c.get("vendor") or ""
         path = c.get("path") or ""
-        print(f"  {name:<12}  {vendor:<14}  {path}")
+        print(f"  {name:<12}  {vendor:<14}  {path}", file=out)
 
-def render_temps(doc: Dict[str, Any]) -> None:
-    rows = extract_temps(doc)
+def render_temps(doc: Dict[str, Any], out: TextIO) -> None:
+    rows = dict_rows(doc, "temps")
     if not rows:
-        print("\nTemperatures: none")
+        print("\nTemperatures: none", file=out)
         return
-    W_CHIP, W_LBL, W_VAL = 14, 24, 8
-    print("\nTemperatures:")
-    print("  " + f"{'Chip':<{W_CHIP}} | {'Label':<{W_LBL}} | {'Value °C':>{W_VAL}} | Path")
-    print(rule([W_CHIP, W_LBL, W_VAL, 10]))
+    print("\nTemperatures:", file=out)
+    print(_HDR_TEMPS, file=out)
+    print(_RULE_TEMPS, file=out)
     for t in rows:
-        chip = os.path.basename(t["chipPath"]) or t["chipPath"]
-        lbl  = t["label"] or os.path.basename(t["inputPath"])
-        print("  " + f"{ell(chip, W_CHIP):<{W_CHIP}} | {ell(lbl, W_LBL):<{W_LBL}} | "
-              f"{fmt_f(t.get('valueC')):>{W_VAL}} | {t['inputPath']}")
-
-def render_fans(doc: Dict[str, Any]) -> None:
-    rows = extract_fans(doc)
+        chip_path  = t.get("chipPath") or ""
+        input_path = t.get("inputPath") or ""
+        chip = os.path.basename(chip_path) or chip_path
+        lbl  = t.get("label") or os.path.basename(input_path)
+        print(_ROW_TEMPS(chip=ell(chip, W_T_CHIP), lbl=ell(lbl, W_T_LBL),
+                         val=fmt_f(t.get("valueC")), path=input_path), file=out)
+
+def render_fans(doc: Dict[str, Any], out: TextIO) -> None:
+    rows = dict_rows(doc, "fans")
     if not rows:
-        print("\nFans: none")
+        print("\nFans: none", file=out)
         return
-    W_CHIP, W_LBL, W_RPM = 14, 24, 7
-    print("\nFans (tach):")
-    print("  " + f"{'Chip':<{W_CHIP}} | {'Label':<{W_LBL}} | {'RPM':>{W_RPM}} | Path")
-    print(rule([W_CHIP, W_LBL, W_RPM, 10]))
+    print("\nFans (tach):", file=out)
+    print(_HDR_FANS, file=out)
+    print(_RULE_FANS, file=out)
     for f in rows:
-        chip = os.path.basename(f["chipPath"]) or f["chipPath"]
-        lbl  = f["label"] or os.path.basename(f["inputPath"])
-        print("  " + f"{ell(chip, W_CHIP):<{W_CHIP}} | {ell(lbl, W_LBL):<{W_LBL}} | "
-              f"{fmt_i(f.get('rpm')):>{W_RPM}} | {f['inputPath']}")
-
-def render_pwms(doc: Dict[str, Any]) -> None:
-    rows = extract_pwms(doc)
+        chip_path  = f.get("chipPath") or ""
+        input_path = f.get("inputPath") or ""
+        chip = os.path.basename(chip_path) or chip_path
+        lbl  = f.get("label") or os.path.basename(input_path)
+        print(_ROW_FANS(chip=ell(chip, W_F_CHIP), lbl=ell(lbl, W_F_LBL),
+                        rpm=fmt_i(f.get("rpm")), path=input_path), file=out)
+
+def render_pwms(doc: Dict[str, Any], out: TextIO) -> None:
+    rows = dict_rows(doc, "pwms")
     if not rows:
-        print("\nPWMs: none")
+        print("\nPWMs: none", file=out)
         return
-    W_CHIP, W_LABEL, W_PCT, W_VAL, W_MODE, W_RPM = 14, 22, 7, 13, 6, 7
-    print("\nPWMs:")
-    print("  " + f"{'Chip':<{W_CHIP}} | {'Label':<{W_LABEL}} | {'Percent':>{W_PCT}} | "
-          f"{'Value/Max':<{W_VAL}} | {'Mode':<{W_MODE}} | {'RPM':>{W_RPM}} | PWM Path")
-    print(rule([W_CHIP, W_LABEL, W_PCT, W_VAL, W_MODE, W_RPM, 10]))
+    print("\nPWMs:", file=out)
+    print(_HDR_PWMS, file=out)
+    print(_RULE_PWMS, file=out)
     for r in rows:
-        chip  = os.path.basename(r["chipPath"]) or r["chipPath"]
-        label = profile_label_for_pwm(doc, r["pwmPath"]) or r.get("label") or os.path.basename(r["pwmPath"])
+        chip_path = r.get("chipPath") or ""
+        pwm_path  = r.get("pwmPath") or ""
+        chip  = os.path.basename(chip_path) or chip_path
+        label = profile_label_for_pwm(doc, pwm_path) or r.get("label") or os.path.basename(pwm_path)
         pct   = "-" if r.get("percent") is None else f"{int(r['percent'])}%"
         raw   = fmt_i(r.get("raw"))
         mxv   = r.get("pwmMax")
         vmax  = "-" if mxv is None else str(mxv)
         v_m   = f"{raw}/{vmax}" if vmax != "-" else raw
         mode  = mode_from_enable(r.get("enable"), bool(r.get("enablePath")))
-        rpm   = fmt_i(r.get("fanRpm"))
-        print("  " + f"{ell(chip, W_CHIP):<{W_CHIP}} | {ell(label, W_LABEL):<{W_LABEL}} | "
-              f"{pct:>{W_PCT}} | {v_m:<{W_VAL}} | {mode:<{W_MODE}} | {rpm:>{W_RPM}} | {r['pwmPath']}")
+        print(_ROW_PWMS(chip=ell(chip, W_P_CHIP), label=ell(label, W_P_LABEL), pct=pct, v_m=v_m,
+                        mode=mode, rpm=fmt_i(r.get("fanRpm")), path=pwm_path), file=out)
 
 
 # ----------------------------- main ------------------------------------------
@@ -337,24 +428,34 @@ def main() -> int:
     signal.signal(signal.SIGINT, _sig)
     signal.signal(signal.SIGTERM, _sig)
 
+    resized = {"flag": False}
+    def _winch(*_a):
+        invalidate_tcols()
+        resized["flag"] = True
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, _winch)
+
+    reader = ShmJsonReader(shm_file)
+
     def tick() -> bool:
-        doc = read_shm_json(shm_file)
+        doc = reader.read()
         if not isinstance(doc, dict):
             print("[!] Could not parse telemetry JSON", file=sys.stderr)
             return False
         if args.json:
             print(json.dumps(doc, indent=2, ensure_ascii=False))
             return True
-        try:
-            os.system("clear")
-        except Exception:
-            pass
-        render_header(doc)
-        render_gpus(doc)
-        render_chips(doc)
-        render_temps(doc)
-        render_fans(doc)
-        render_pwms(doc)
+        # Compose the whole frame first, then hand it to the terminal in one write
+        frame = io.StringIO()
+        # home + erase screen/scrollback, same as clear(1) but without a fork/exec per tick
+        frame.write(CLEAR_SCREEN)
+        render_header(doc, frame)
+        render_gpus(doc, frame)
+        render_chips(doc, frame)
+        render_temps(doc, frame)
+        render_fans(doc, frame)
+        render_pwms(doc, frame)
+        sys.stdout.write(frame.getvalue())
         sys.stdout.flush()
         return True
 
@@ -363,13 +464,45 @@ def main() -> int:
         return 0 if ok else 3
 
     iv = max(0.1, float(args.interval))
-    last = 0.0
+    watcher = ShmWatcher(shm_file)
+    if watcher.fd < 0:
+        last = 0.0
+        while not stopping["flag"]:
+            now = time.time()
+            if now - last >= iv:
+                tick()
+                last = now
+            time.sleep(0.05)
+        return 0
+
+    # Event driven: sleep until lfcd publishes, redraw at most once per interval.
+    # Signals are delivered through a wakeup pipe so select() returns on Ctrl-C.
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+
+    tick()
+    last = time.monotonic()
+    dirty = False
     while not stopping["flag"]:
-        now = time.time()
-        if now - last >= iv:
+        timeout = max(0.0, last + iv - time.monotonic()) if dirty else None
+        ready, _, _ = select.select([watcher.fd, wake_r], [], [], timeout)
+        if wake_r in ready:
+            try:
+                while os.read(wake_r, 512):
+                    pass
+            except BlockingIOError:
+                pass
+        if resized["flag"]:
+            resized["flag"] = False
+            dirty = True   # re-layout the current frame for the new width
+        if watcher.fd in ready and watcher.drain():
+            dirty = True
+        if dirty and time.monotonic() - last >= iv:
             tick()
-            last = now
-        time.sleep(0.05)
+            last = time.monotonic()
+            dirty = False
 
     return 0
 
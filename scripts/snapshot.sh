@@ -3,43 +3,60 @@ set -Eeuo pipefail
 
 ROOT="${1:-$(pwd)}"
 OUT_DIR="${2:-/tmp/lfc_snapshot}"
+# Inhalte größerer Dateien nicht in den Dump übernehmen (Manifest/ZIP bleiben vollständig)
+MAX_DUMP_BYTES="${MAX_DUMP_BYTES:-2000000}"
 mkdir -p "$OUT_DIR"
 
 echo "[i] Root        : $ROOT"
 echo "[i] Output dir  : $OUT_DIR"
+echo "[i] Dump limit  : $MAX_DUMP_BYTES bytes/file"
 
 # Filter: alles außer Build-/Tool-Ordnern und großen Binary-Artefakten
-readarray -t FILES < <(
-  find "$ROOT" -type f \
-    -not -path "*/.git/*" \
-    -not -path "*/build/*" \
-    -not -path "*/bin/*" \
-    -not -path "*/obj/*" \
-    -not -path "*/.idea/*" \
-    -not -path "*/.vs/*" \
-    -not -path "*/.vscode/*" \
-    -not -name "*.png" \
-    -not -name "*.jpg" \
-    -not -name "*.jpeg" \
-    -not -name "*.gif" \
-    -not -name "*.svg" \
-    -not -name "*.ico" \
-    -not -name "*.pdf" \
-    -not -name "*.zip" \
-    -not -name "*.tar" \
-    -not -name "*.tar.gz" \
-    -not -name "*.tgz" \
-    -not -name "*.7z" \
-    -not -name "*.dll" \
-    -not -name "*.so" \
-    -not -name "*.wasm" \
-    -not -name "*.pdb" \
-    -not -name "*.a" \
-    -not -name "*.o" \
+# Ausgeschlossene Ordner werden per -prune gar nicht erst betreten
+readarray -d '' FILES < <(
+  find "$ROOT" -mindepth 1 \
+    -type d \( -name .git -o -name build -o -name bin -o -name obj \
+               -o -name .idea -o -name .vs -o -name .vscode \) -prune \
+    -o -type f \
+    -regextype posix-extended -not -regex ".*\.(png|jpg|jpeg|gif|svg|ico|pdf|zip|tar|tar\.gz|tgz|7z|dll|so|wasm|pdb|a|o)" \
     -not -name "project.assets.json" \
-    | LC_ALL=C sort
+    -print0 \
+    | LC_ALL=C sort -z
 )
 
+# Größe + SHA256 einmal pro Datei bestimmen; Manifest und Dump nutzen dieselben Werte.
+# Gebündelt statt pro Datei zu forken: ein stat-Aufruf, sha256sum parallel über alle CPUs.
+RELS=("${FILES[@]#$ROOT/}")
+SIZES=(); SHAS=()
+if (( ${#FILES[@]} )); then
+  readarray -t SIZES < <(printf '%s\0' "${FILES[@]}" | xargs -0 stat -c %s --)
+  # Jeder sha256sum-Batch schreibt in eine eigene Datei (keine verschränkten Zeilen
+  # zwischen parallelen Prozessen). Mit --zero (coreutils >= 9) bleiben Namen
+  # unescaped; ohne --zero werden escapte Zeilen ("\hash  a\\b") übersprungen.
+  SHA_TMP="$(mktemp -d)"
+  trap 'rm -rf "$SHA_TMP"' EXIT
+  ZERO=(); DELIM=$'\n'
+  if sha256sum --zero /dev/null >/dev/null 2>&1; then ZERO=(--zero); DELIM=''; fi
+  printf '%s\0' "${FILES[@]}" \
+    | xargs -0 -n 64 -P "$(nproc)" sh -c 'sha256sum "$@" 2>/dev/null > "$(mktemp -p "$0")"' "$SHA_TMP" "${ZERO[@]}" -- \
+    || true
+  declare -A SHA_BY_PATH=()
+  for out in "$SHA_TMP"/*; do
+    [[ -e "$out" ]] || continue
+    while IFS= read -r -d "$DELIM" rec; do
+      [[ "$rec" == \\* ]] && continue
+      SHA_BY_PATH["${rec:66}"]="${rec:0:64}"
+    done < "$out"
+  done
+  for i in "${!FILES[@]}"; do
+    SHAS[$i]="${SHA_BY_PATH[${FILES[$i]}]:-}"
+    # Rest (escapte Namen ohne --zero, Lesefehler) einzeln über stdin hashen
+    if [[ -z "${SHAS[$i]}" ]]; then
+      SHAS[$i]="$(sha256sum < "${FILES[$i]}" 2>/dev/null | cut -c1-64 || true)"
+    fi
+  done
+fi
+
 # 1) Manifest
 MANIFEST="$OUT_DIR/manifest.txt"
 {
@@ -47,32 +64,27 @@ MANIFEST="$OUT_DIR/manifest.txt"
   echo "# generated: $(date -Is)"
   echo "# root: $ROOT"
   echo
-  for f in "${FILES[@]}"; do
-    rel="${f#$ROOT/}"
-    # kurze Größe + SHA256
-    size=$(wc -c <"$f" | tr -d ' ')
-    sha=$(sha256sum "$f" | awk '{print $1}')
-    echo "$rel|$size|$sha"
+  for i in "${!FILES[@]}"; do
+    echo "${RELS[$i]}|${SIZES[$i]}|${SHAS[$i]}"
   done
 } > "$MANIFEST"
 echo "[i] Wrote $MANIFEST"
 
 # 2) Dump aller Dateien mit Inhalt
 DUMP="$OUT_DIR/repo_dump.txt"
-: > "$DUMP"
-for f in "${FILES[@]}"; do
-  rel="${f#$ROOT/}"
-  size=$(wc -c <"$f" | tr -d ' ')
-  sha=$(sha256sum "$f" | awk '{print $1}')
-  {
+{
+  for i in "${!FILES[@]}"; do
+    f="${FILES[$i]}"
     echo
     echo "===== FILE START ====="
-    echo "PATH : $rel"
-    echo "SIZE : $size bytes"
-    echo "SHA256: $sha"
+    echo "PATH : ${RELS[$i]}"
+    echo "SIZE : ${SIZES[$i]} bytes"
+    echo "SHA256: ${SHAS[$i]}"
     echo "----- CONTENT BEGIN -----"
+    if (( ${SIZES[$i]} > MAX_DUMP_BYTES )); then
+      echo "[skipped: ${SIZES[$i]} bytes > MAX_DUMP_BYTES=$MAX_DUMP_BYTES]"
     # sicherstellen, dass alles lesbar UTF-8 ist
-    if iconv -f UTF-8 -t UTF-8 "$f" >/dev/null 2>&1; then
+    elif iconv -f UTF-8 -t UTF-8 "$f" >/dev/null 2>&1; then
       cat "$f"
     else
       iconv -f ISO-8859-1 -t UTF-8 "$f" 2>/dev/null || cat "$f"
@@ -80,17 +92,15 @@ for f in "${FILES[@]}"; do
     echo
     echo "----- CONTENT END -----"
     echo "=====  FILE END  ====="
-  } >> "$DUMP"
-done
+  done
+} > "$DUMP"
 echo "[i] Wrote $DUMP"
 
 # Optional zusätzlich ZIP
 ZIP="$OUT_DIR/lfc_snapshot.zip"
+# Bereits gefilterte Dateiliste übergeben statt erneut zu traversieren und jede Datei gegen -x zu prüfen
 ( cd "$ROOT" && \
-  zip -q -r "$ZIP" . \
-    -x "*.git/*" "build/*" "bin/*" "obj/*" ".idea/*" ".vs/*" ".vscode/*" \
-    "*.png" "*.jpg" "*.jpeg" "*.gif" "*.svg" "*.ico" "*.pdf" "*.zip" "*.tar" "*.tar.gz" "*.tgz" "*.7z" \
-    "*.dll" "*.so" "*.wasm" "*.pdb" "*.a" "*.o" "project.assets.json" \
+  printf '%s\n' "${RELS[@]}" | zip -q "$ZIP" -@ \
 )
 echo "[i] Wrote $ZIP"
 
@@ -15,7 +15,6 @@
 
 #include <chrono>
 #include <filesystem>
-#include <fstream>
 #include <thread>
 
 namespace fs = std::filesystem;
@@ -239,8 +238,12 @@ void Daemon::rememberOriginalEnables() {
 void Daemon::restoreOriginalEnables() {
     LOG_DEBUG("daemon: restoreOriginalEnables");
     for (const auto& it : origPwmEnable_) {
-        std::ofstream f(it.first);
-        if (f) { f << it.second; }
+        if (it.first.empty()) continue;
+        HwmonPwm p{};
+        p.path_enable = it.first;
+        // Only write where the current mode differs from the remembered one
+        if (Hwmon::readEnable(p) == it.second) continue;
+        Hwmon::setEnable(p, it.second);
     }
     origPwmEnable_.clear();
 }
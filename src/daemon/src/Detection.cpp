@@ -10,8 +10,8 @@
 
 #include <algorithm>
 #include <cmath>
-#include <thread>
 #include <chrono>
+#include <unordered_map>
 
 namespace lfc {
 
@@ -32,7 +32,7 @@ bool Detection::ensureManualMode_(const HwmonPwm& p) {
     int tries = cfg_.maxPwmToggleTries;
     while (tries-- > 0) {
         if (Hwmon::setEnable(p, 1)) {
-            std::this_thread::sleep_for(std::chrono::milliseconds(cfg_.modeDwellMs));
+            if (!sleepMsCancelable_(cfg_.modeDwellMs)) return false;
             auto mode = Hwmon::readEnable(p).value_or(-1);
             if (mode == 1) return true;
         }
@@ -41,34 +41,27 @@ bool Detection::ensureManualMode_(const HwmonPwm& p) {
 }
 
 bool Detection::restoreMode_(const HwmonPwm& p, int prevMode, int prevRaw) {
+    // Read-compare first; only attributes that actually changed are written back
     bool ok = true;
-    ok &= Hwmon::setEnable(p, prevMode);
-    ok &= Hwmon::setRaw(p, prevRaw);
+    if (Hwmon::readEnable(p) != prevMode) ok &= Hwmon::setEnable(p, prevMode);
+    if (Hwmon::readRaw(p) != prevRaw)     ok &= Hwmon::setRaw(p, prevRaw);
     return ok;
 }
 
 bool Detection::spinupCheck_(const HwmonPwm& p, bool& ok) {
     ok = false;
 
-    const int prevMode = Hwmon::readEnable(p).value_or(2);
-    const int prevRaw  = Hwmon::readRaw(p).value_or(0);
-
-    if (!ensureManualMode_(p)) {
-        LOG_WARN("detect: ensureManualMode failed for %s", p.path_pwm.c_str());
+    if (!Hwmon::setPercent(p, 100)) {
         return false;
     }
 
-    Hwmon::setPercent(p, 100);
-    const auto t0 = std::chrono::steady_clock::now();
-    while (true) {
-        // heuristic: give it some time; the real verification happens in measureCurve_
-        auto dt = std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::steady_clock::now() - t0).count();
-        if (dt >= cfg_.spinupCheckMs) break;
-        std::this_thread::sleep_for(std::chrono::milliseconds(cfg_.spinupPollMs));
+    // heuristic: give it some time; the real verification happens in measureCurve_
+    // Single cancelable wait instead of polling; requestStop() ends it early.
+    if (cfg_.spinupCheckMs > 0) {
+        if (!sleepMsCancelable_(cfg_.spinupCheckMs)) return false;
         ok = true; // optimistic signal; refined later
     }
 
-    restoreMode_(p, prevMode, prevRaw);
     return true;
 }
 
@@ -78,18 +71,18 @@ bool Detection::measureCurve_(const HwmonPwm& p,
 {
     out.clear();
 
-    const int prevMode = Hwmon::readEnable(p).value_or(2);
-    const int prevRaw  = Hwmon::readRaw(p).value_or(0);
-
-    if (!ensureManualMode_(p)) {
-        LOG_WARN("detect: ensureManualMode failed for %s", p.path_pwm.c_str());
-        return false;
-    }
-
     const int startPct = clamp01i(cfg_.rampStartPercent);
     const int endPct   = clamp01i(cfg_.rampEndPercent);
     const int totalMs  = std::max(cfg_.measureTotalMs, 1000);
 
+    // Build the sensor set and size the result once, not per duty step
+    std::vector<HwmonTemp> temps;
+    temps.reserve(tempPaths.size());
+    for (const auto& path : tempPaths) {
+        temps.push_back(HwmonTemp{.chipPath = p.chipPath, .path_input = path, .label = {}});
+    }
+    if (endPct >= startPct) out.reserve(static_cast<size_t>((endPct - startPct) / 5 + 1));
+
     const auto t0 = std::chrono::steady_clock::now();
     int lastRpm = -1;
 
@@ -97,13 +90,12 @@ bool Detection::measureCurve_(const HwmonPwm& p,
         if (stop_.load(std::memory_order_relaxed)) break;
 
         Hwmon::setPercent(p, duty);
-        if (!sleepMsCancelable_(cfg_.settleMs, stop_)) break;
+        if (!sleepMsCancelable_(cfg_.settleMs)) break;
 
         // Aggregate temperature (max across selected sensors)
         double aggC = 0.0;
         bool have = false;
-        for (const auto& path : tempPaths) {
-            HwmonTemp t{.chipPath = p.chipPath, .path_input = path, .label = {}};
+        for (const auto& t : temps) {
             auto v = Hwmon::readTempC(t);
             if (v) {
                 aggC = have ? std::max(aggC, *v) : *v;
@@ -128,7 +120,6 @@ bool Detection::measureCurve_(const HwmonPwm& p,
         if (dt >= totalMs) break;
     }
 
-    restoreMode_(p, prevMode, prevRaw);
     return out.size() >= static_cast<size_t>(std::max(1, cfg_.minValidPoints));
 }
 
@@ -155,6 +146,12 @@ bool Detection::runAutoDetect(const HwmonSnapshot& hw, DetectResult& result) {
         p.hwmons.push_back(dm);
     }
 
+    // Temperature inputs grouped by chip once, instead of scanning all temps per PWM
+    std::unordered_map<std::string, std::vector<std::string>> tempPathsByChip;
+    for (const auto& t : hw.temps) {
+        tempPathsByChip[t.chipPath].push_back(t.path_input);
+    }
+
     int mapped = 0;
 
     for (const auto& pwm : hw.pwms) {
@@ -167,18 +164,28 @@ bool Detection::runAutoDetect(const HwmonSnapshot& hw, DetectResult& result) {
 
         report_(15, DetectStage::SpinupCheck, pwm.label.empty() ? pwm.path_pwm : pwm.label);
 
+        // One manual-mode session per PWM: snapshot, switch (incl. dwell) and
+        // restore once around both the spin-up check and the curve measurement.
+        const int prevMode = Hwmon::readEnable(pwm).value_or(2);
+        const int prevRaw  = Hwmon::readRaw(pwm).value_or(0);
+
+        if (!ensureManualMode_(pwm)) {
+            LOG_WARN("detect: ensureManualMode failed for %s", pwm.path_pwm.c_str());
+            restoreMode_(pwm, prevMode, prevRaw);
+            continue;
+        }
+
         bool canSpin = false;
         if (!spinupCheck_(pwm, canSpin)) {
             LOG_TRACE("detect: spinupCheck fail for %s", pwm.path_pwm.c_str());
+            restoreMode_(pwm, prevMode, prevRaw);
             continue;
         }
 
         // Select temperature sensors on the same chip; fallback to a global first sensor
         std::vector<std::string> tpaths;
-        for (const auto& t : hw.temps) {
-            if (t.chipPath == pwm.chipPath) {
-                tpaths.push_back(t.path_input);
-            }
+        if (auto it = tempPathsByChip.find(pwm.chipPath); it != tempPathsByChip.end()) {
+            tpaths = it->second;
         }
         if (tpaths.empty() && !hw.temps.empty()) {
             tpaths.push_back(hw.temps.front().path_input);
@@ -186,7 +193,9 @@ bool Detection::runAutoDetect(const HwmonSnapshot& hw, DetectResult& result) {
 
         report_(30, DetectStage::MeasureCurve, pwm.path_pwm);
         std::vector<CurvePoint> points;
-        if (!measureCurve_(pwm, tpaths, points)) {
+        const bool measured = measureCurve_(pwm, tpaths, points);
+        restoreMode_(pwm, prevMode, prevRaw);
+        if (!measured) {
             LOG_DEBUG("detect: measureCurve no points for %s", pwm.path_pwm.c_str());
             continue;
         }
@@ -235,15 +244,12 @@ int Detection::readRpmSafe_(const HwmonFan& f, int fallback) {
     return r;
 }
 
-bool Detection::sleepMsCancelable_(int ms, const std::atomic<bool>& stopFlag) {
+bool Detection::sleepMsCancelable_(int ms) {
     LOG_TRACE("detect: sleep %dms (cancelable)", ms);
-    using namespace std::chrono;
-    auto until = steady_clock::now() + milliseconds(ms);
-    while (steady_clock::now() < until) {
-        if (stopFlag.load(std::memory_order_relaxed)) return false;
-        std::this_thread::sleep_for(milliseconds(5));
-    }
-    return true;
+    // Block once for the whole interval; requestStop() wakes us immediately.
+    std::unique_lock<std::mutex> lk(stopMtx_);
+    return !stopCv_.wait_for(lk, std::chrono::milliseconds(ms),
+                             [this] { return stop_.load(std::memory_order_relaxed); });
 }
 
 } // namespace lfc
@@ -18,6 +18,8 @@
 #include <algorithm>
 #include <cmath>
 #include <string>
+#include <string_view>
+#include <unordered_map>
 #include <vector>
 
 
@@ -28,6 +30,9 @@ static std::unordered_set<std::string> s_gpuManagedChipPaths;  // per chipPath (
 static std::unordered_set<std::string> s_writeWarnedOnce;      // per PWM path (warn once)
 namespace lfc {
 
+// Unchanged duties are not rewritten every tick, only refreshed at this interval.
+static constexpr auto kRewriteInterval = std::chrono::seconds(5);
+
 Engine::Engine() = default;
 Engine::~Engine() = default;
 
@@ -38,13 +43,20 @@ void Engine::setHwmonView(const std::vector<HwmonTemp>& temps,
     temps_ = temps;
     fans_  = fans;
     pwms_  = pwms;
+    rebuildBindings();
     LOG_DEBUG("engine: hwmon view set (temps=%zu fans=%zu pwms=%zu)", temps_.size(), fans_.size(), pwms_.size());
 }
 
 void Engine::applyProfile(const Profile& p) {
     profile_ = p;
+    // Sort graph points once here so curvePercent() can binary-search every tick
+    for (auto& c : profile_.fanCurves) {
+        std::stable_sort(c.points.begin(), c.points.end(),
+                         [](const CurvePoint& a, const CurvePoint& b) { return a.tempC < b.tempC; });
+    }
     // Keep state vector size in sync with controls
     ruleState_.assign(profile_.controls.size(), RuleState{});
+    rebuildBindings();
     LOG_INFO("engine: profile applied '%s' (controls=%zu curves=%zu)",
              profile_.name.c_str(), profile_.controls.size(), profile_.fanCurves.size());
 }
@@ -57,6 +69,36 @@ static std::string controlLabel(const ControlMeta& c, const HwmonPwm* pwm) {
     return std::string{"(unnamed)"};
 }
 
+void Engine::rebuildBindings() {
+    std::unordered_map<std::string_view, const HwmonPwm*> pwmByPath;
+    pwmByPath.reserve(pwms_.size());
+    for (const auto& p : pwms_) pwmByPath.emplace(p.path_pwm, &p);
+
+    std::unordered_map<std::string_view, const HwmonTemp*> tempByPath;
+    tempByPath.reserve(temps_.size());
+    for (const auto& t : temps_) tempByPath.emplace(t.path_input, &t);
+
+    std::unordered_map<std::string_view, const FanCurveMeta*> curveByName;
+    curveByName.reserve(profile_.fanCurves.size());
+    for (const auto& c : profile_.fanCurves) curveByName.emplace(c.name, &c);
+
+    bindings_.assign(profile_.controls.size(), ControlBinding{});
+    for (size_t i = 0; i < profile_.controls.size(); ++i) {
+        const auto& ctrl = profile_.controls[i];
+        ControlBinding& b = bindings_[i];
+
+        if (auto it = pwmByPath.find(ctrl.pwmPath); it != pwmByPath.end()) b.pwm = it->second;
+        b.label = controlLabel(ctrl, b.pwm);
+        if (auto it = curveByName.find(ctrl.curveRef); it != curveByName.end()) b.curve = it->second;
+        if (!b.curve) continue;
+
+        b.temps.reserve(b.curve->tempSensors.size());
+        for (const auto& path : b.curve->tempSensors) {
+            if (auto it = tempByPath.find(path); it != tempByPath.end()) b.temps.push_back(it->second);
+        }
+    }
+}
+
 bool Engine::tick(double deltaC) {
     bool anyChanged = false;
 
@@ -66,10 +108,14 @@ bool Engine::tick(double deltaC) {
                   ruleState_.size(), profile_.controls.size());
         ruleState_.assign(profile_.controls.size(), RuleState{});
     }
+    if (bindings_.size() != profile_.controls.size()) {
+        rebuildBindings();
+    }
 
     for (size_t i = 0; i < profile_.controls.size(); ++i) {
         const auto& ctrl = profile_.controls[i];
         RuleState& st = ruleState_[i];
+        const ControlBinding& bind = bindings_[i];
 
         // Skip disabled controls entirely
         if (!ctrl.enabled) {
@@ -80,19 +126,16 @@ bool Engine::tick(double deltaC) {
             continue;
         }
 
-        const HwmonPwm* pwm = findPwm(ctrl.pwmPath);
-        const std::string label = controlLabel(ctrl, pwm);
+        const HwmonPwm* pwm = bind.pwm;
+        const std::string& label = bind.label;
 
         if (!pwm) {
             LOG_WARN("engine: pwm not found: %s [%s]", ctrl.pwmPath.c_str(), label.c_str());
             continue;
         }
 
-        // Resolve referenced curve
-        const FanCurveMeta* curve = nullptr;
-        for (const auto& c : profile_.fanCurves) {
-            if (c.name == ctrl.curveRef) { curve = &c; break; }
-        }
+        // Referenced curve (resolved in rebuildBindings)
+        const FanCurveMeta* curve = bind.curve;
         if (!curve) {
             LOG_WARN("engine: curve not found: %s [%s -> %s]",
                      ctrl.curveRef.c_str(), label.c_str(), pwm->path_pwm.c_str());
@@ -101,10 +144,8 @@ bool Engine::tick(double deltaC) {
 
         // Aggregate temperatures from the curve's sensor list
         std::vector<double> tempsC;
-        tempsC.reserve(curve->tempSensors.size());
-        for (const auto& path : curve->tempSensors) {
-            const HwmonTemp* t = findTempSensor(path);
-            if (!t) continue;
+        tempsC.reserve(bind.temps.size());
+        for (const HwmonTemp* t : bind.temps) {
             auto v = Hwmon::readTempC(*t);
             if (v) tempsC.push_back(*v);
         }
@@ -145,25 +186,32 @@ bool Engine::tick(double deltaC) {
         // Optional per-control hysteresis smoothing
         const int outPct = applyHysteresis(st, targetPct);
 
-        // Ensure manual mode (pwm*_enable = 1) before attempting to write duty
-        {
-            auto en = Hwmon::readEnable(*pwm);
-            if (!en || *en != 1) {
-                if (Hwmon::setEnable(*pwm, 1)) {
-                    LOG_DEBUG("engine: set manual mode (enable=1) on %s [%s]",
-                              pwm->path_pwm.c_str(), label.c_str());
-                } else {
-                    LOG_WARN("engine: failed to set manual mode on %s [%s]",
-                             pwm->path_pwm.c_str(), label.c_str());
-                    // weiter; einige Treiber akzeptieren Duty-Writes trotzdem
+        // Write only if the resulting duty differs; re-assert an unchanged duty
+        // (and manual mode) at most every kRewriteInterval in case firmware took over.
+        const auto now       = std::chrono::steady_clock::now();
+        const bool changed   = outPct != st.lastPercent;
+        const bool heartbeat = !changed && (now - st.lastWrite) >= kRewriteInterval;
+        if (changed || heartbeat) {
+            // Ensure manual mode (pwm*_enable = 1) before attempting to write duty
+            {
+                auto en = Hwmon::readEnable(*pwm);
+                if (!en || *en != 1) {
+                    if (Hwmon::setEnable(*pwm, 1)) {
+                        LOG_DEBUG("engine: set manual mode (enable=1) on %s [%s]",
+                                  pwm->path_pwm.c_str(), label.c_str());
+                    } else {
+                        LOG_WARN("engine: failed to set manual mode on %s [%s]",
+                                 pwm->path_pwm.c_str(), label.c_str());
+                        // weiter; einige Treiber akzeptieren Duty-Writes trotzdem
+                    }
                 }
             }
-        }
 
-        // Apply only if resulting duty differs
-        if (outPct != st.lastPercent) {
             if (Hwmon::setPercent(*pwm, outPct)) {
-                if (st.hasLastTemp) {
+                if (heartbeat) {
+                    LOG_TRACE("engine: refresh %s [%s] <- %d%% (unchanged)",
+                              pwm->path_pwm.c_str(), label.c_str(), outPct);
+                } else if (st.hasLastTemp) {
                     LOG_DEBUG("engine: set %s [%s] <- %d%% (was %d%%) @ avgTemp=%.2f°C; Δ=%.3f°C ≥ gate=%.3f°C",
                               pwm->path_pwm.c_str(), label.c_str(),
                               outPct, st.lastPercent, avgTempC, deltaAbs, deltaC);
@@ -173,7 +221,8 @@ bool Engine::tick(double deltaC) {
                               outPct, st.lastPercent, avgTempC, deltaC);
                 }
                 st.lastPercent = outPct;
-                anyChanged = true;
+                st.lastWrite   = now;
+                if (changed) anyChanged = true;
             } else {
                 LOG_WARN("engine: setPercent failed on %s [%s] -> %d%%",
                          pwm->path_pwm.c_str(), label.c_str(), outPct);
@@ -189,20 +238,6 @@ bool Engine::tick(double deltaC) {
     return anyChanged;
 }
 
-const HwmonPwm* Engine::findPwm(const std::string& path) const {
-    for (const auto& p : pwms_) {
-        if (p.path_pwm == path) return &p;
-    }
-    return nullptr;
-}
-
-const HwmonTemp* Engine::findTempSensor(const std::string& path) const {
-    for (const auto& t : temps_) {
-        if (t.path_input == path) return &t;
-    }
-    return nullptr;
-}
-
 int Engine::curvePercent(const FanCurveMeta& curve, double tempC) const {
     if (curve.points.empty()) return 0;
 
@@ -214,18 +249,17 @@ int Engine::curvePercent(const FanCurveMeta& curve, double tempC) const {
         return clamp01(pts.back().percent);
     }
 
-    for (size_t i = 1; i < pts.size(); ++i) {
-        const CurvePoint& a = pts[i - 1];
-        const CurvePoint& b = pts[i];
-        if (tempC <= b.tempC) {
-            const double den = std::max(1e-9, (b.tempC - a.tempC));
-            const double u = (tempC - a.tempC) / den;
-            const double y = static_cast<double>(a.percent) +
-                             u * (static_cast<double>(b.percent) - static_cast<double>(a.percent));
-            return clamp01(static_cast<int>(std::lround(y)));
-        }
-    }
-    return clamp01(pts.back().percent);
+    // Points are sorted by tempC (applyProfile); first point with b.tempC >= tempC
+    // lies strictly inside (front, back] here, so it has a predecessor.
+    const auto it = std::lower_bound(pts.begin(), pts.end(), tempC,
+                                     [](const CurvePoint& p, double t) { return p.tempC < t; });
+    const CurvePoint& a = *(it - 1);
+    const CurvePoint& b = *it;
+    const double den = std::max(1e-9, (b.tempC - a.tempC));
+    const double u = (tempC - a.tempC) / den;
+    const double y = static_cast<double>(a.percent) +
+                     u * (static_cast<double>(b.percent) - static_cast<double>(a.percent));
+    return clamp01(static_cast<int>(std::lround(y)));
 }
 
 int Engine::applyHysteresis(RuleState& st, int target) {
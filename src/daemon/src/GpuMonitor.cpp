@@ -13,6 +13,7 @@
 #include <fstream>
 #include <optional>
 #include <string>
+#include <unordered_map>
 #include <sys/stat.h>
 #include <unistd.h>
 #include <vector>
@@ -47,8 +48,8 @@ static std::optional<int> readIntFile(const std::string& p) {
 static std::optional<double> readTempC(const std::string& inputPath) {
     auto iv = readIntFile(inputPath);
     if (!iv) return std::nullopt;
-    if (std::abs(*iv) > 2000) return (*iv) / 1000.0; // millidegree → °C
-    return static_cast<double>(*iv);
+    // hwmon temps are millidegree Celsius
+    return static_cast<double>(*iv) / 1000.0;
 }
 
 static std::optional<std::string> readSmall(const std::string& p) {
@@ -100,12 +101,9 @@ static std::vector<std::string> drmCards() {
     return out;
 }
 
-static std::optional<std::string> pciIdFromDrmCard(const std::string& cardName) {
-    // /sys/class/drm/cardN/device -> ../../../0000:03:00.0
-    auto devLink = "/sys/class/drm/" + cardName + "/device";
-    auto rp = realpathStr(devLink);
-    if (!rp) return std::nullopt;
-    fs::path p(*rp);
+static std::optional<std::string> pciIdFromDeviceReal(const std::string& devReal) {
+    // realpath of /sys/class/drm/cardN/device, e.g. /sys/devices/pci0000:00/.../0000:03:00.0
+    fs::path p(devReal);
     while (p.has_parent_path()) {
         auto bn = p.filename().string();
         if (bn.size() >= 12 && bn.find(':') != std::string::npos && bn.find('.') != std::string::npos) {
@@ -355,9 +353,13 @@ void GpuMonitor::discover(std::vector<GpuSample>& out) {
     out.clear();
     const auto cards = drmCards();
 
+    // Resolve each card's device symlink once; reused for the pci.ids fallback below.
+    std::unordered_map<std::string, std::string> devRealByCard;
+
     for (const auto& card : cards) {
-        const auto pci       = pciIdFromDrmCard(card).value_or(std::string{});
         const auto devReal   = deviceRealFromDrmCard(card);
+        const auto pci       = devReal ? pciIdFromDeviceReal(*devReal).value_or(std::string{}) : std::string{};
+        if (devReal) devRealByCard.emplace(card, *devReal);
         const auto hwmonBase = devReal ? hwmonBaseForDeviceReal(*devReal).value_or(std::string{}) : std::string{};
 
         const auto tach = hwmonBase.empty() ? std::optional<TachInfo>{} : findFanTach(hwmonBase);
@@ -421,9 +423,9 @@ void GpuMonitor::discover(std::vector<GpuSample>& out) {
     // Fallback pretty-name if vendor SDKs did not fill s.name
     for (auto& s : out) {
         if (!s.name.empty()) continue;
-        auto devReal = deviceRealFromDrmCard(s.drmCard);
-        if (devReal) {
-            maybeSetPrettyNameFromPciIds(s, *devReal);
+        auto it = devRealByCard.find(s.drmCard);
+        if (it != devRealByCard.end()) {
+            maybeSetPrettyNameFromPciIds(s, it->second);
         }
     }
 }
@@ -437,15 +439,23 @@ void GpuMonitor::refreshMetrics(std::vector<GpuSample>& gpus) {
             s.tempMemoryC.reset();
             continue;
         }
-        const auto tach = findFanTach(s.hwmonPath);
-        if (tach) s.fanRpm = tach->rpm; else s.fanRpm.reset();
-
-        const auto edge = fs::path(s.hwmonPath) / "temp1_input";
-        const auto hot  = fs::path(s.hwmonPath) / "temp2_input";
-        const auto mem  = fs::path(s.hwmonPath) / "temp3_input";
-        s.tempEdgeC    = isFile(edge.string()) ? readTempC(edge.string()) : std::optional<double>{};
-        s.tempHotspotC = isFile(hot .string()) ? readTempC(hot .string()) : std::optional<double>{};
-        s.tempMemoryC  = isFile(mem .string()) ? readTempC(mem .string()) : std::optional<double>{};
+        // Periodic path: go through Hwmon's cached-fd readers. A missing
+        // attribute just fails to open, so no separate stat() per file.
+        const std::string base = s.hwmonPath + "/";
+
+        s.fanRpm.reset();
+        for (int i = 1; i <= 8 && !s.fanRpm; ++i) {
+            s.fanRpm = Hwmon::readRpm(HwmonFan{.chipPath = s.hwmonPath,
+                                               .path_input = base + "fan" + std::to_string(i) + "_input",
+                                               .label = {}});
+        }
+
+        auto temp = [&](const char* attr) {
+            return Hwmon::readTempC(HwmonTemp{.chipPath = s.hwmonPath, .path_input = base + attr, .label = {}});
+        };
+        s.tempEdgeC    = temp("temp1_input");
+        s.tempHotspotC = temp("temp2_input");
+        s.tempMemoryC  = temp("temp3_input");
     }
 }
 
@@ -16,26 +16,31 @@
 
 #include <algorithm>
 #include <cerrno>
+#include <charconv>
 #include <cinttypes>
 #include <cmath>
+#include <cstdlib>
 #include <filesystem>
 #include <fstream>
+#include <mutex>
 #include <optional>
+#include <set>
 #include <string>
 #include <string_view>
 #include <system_error>
+#include <unordered_map>
+#include <unordered_set>
 #include <vector>
 
+#include <fcntl.h>
+#include <unistd.h>
+
 namespace fs = std::filesystem;
 
 namespace lfc {
 
 /* ------------------------------ fs helpers -------------------------------- */
 
-static inline bool fileExists(const fs::path& p) {
-    std::error_code ec;
-    return fs::exists(p, ec);
-}
 static std::string readFirstLine(const fs::path& p) {
     std::ifstream f(p);
     std::string s;
@@ -55,11 +60,90 @@ static std::optional<int> readInt(const fs::path& p) {
     if (!v) return std::nullopt;
     return static_cast<int>(*v);
 }
-static bool writeInt(const fs::path& p, int value) {
-    std::ofstream f(p);
-    if (!f) return false;
-    f << value;
-    return static_cast<bool>(f);
+
+/* --------------------------- cached sysfs reads --------------------------- */
+
+// Live values (temps, tachs, pwm/enable readback) are polled every tick
+// (engine + telemetry + detection). Keep one O_RDONLY fd per attribute and
+// pread() from offset 0 (sysfs regenerates the value on each read at offset 0)
+// instead of open/read/close per sample. A failing fd is dropped and reopened
+// once, e.g. after a driver reload.
+static std::mutex s_readFdMtx;
+static std::unordered_map<std::string, int> s_readFds;
+
+static std::optional<long> preadLong(const std::string& path) {
+    std::lock_guard<std::mutex> lk(s_readFdMtx);
+    for (int attempt = 0; attempt < 2; ++attempt) {
+        int fd = -1;
+        bool cached = false;
+        if (attempt == 0) {
+            auto it = s_readFds.find(path);
+            if (it != s_readFds.end()) { fd = it->second; cached = true; }
+        }
+        if (!cached) {
+            fd = ::open(path.c_str(), O_RDONLY | O_CLOEXEC);
+            if (fd < 0) return std::nullopt;
+            s_readFds[path] = fd;
+        }
+
+        char buf[32];
+        const ssize_t n = ::pread(fd, buf, sizeof(buf) - 1, 0);
+        if (n > 0) {
+            buf[n] = '\0';
+            char* end = nullptr;
+            errno = 0;
+            const long v = std::strtol(buf, &end, 10);
+            if (end == buf || errno == ERANGE) return std::nullopt;
+            return v;
+        }
+
+        s_readFds.erase(path);
+        ::close(fd);
+        if (!cached) break;
+    }
+    return std::nullopt;
+}
+static std::optional<int> preadInt(const std::string& path) {
+    auto v = preadLong(path);
+    if (!v) return std::nullopt;
+    return static_cast<int>(*v);
+}
+
+// pwmN / pwmN_enable are written repeatedly (engine ticks, detection sweeps,
+// restore). Same scheme as reads: one cached O_WRONLY fd per attribute, written
+// at offset 0; on failure the fd is dropped and the write retried once on a
+// fresh open. errno of the failing write is preserved for the caller's log.
+static std::mutex s_writeFdMtx;
+static std::unordered_map<std::string, int> s_writeFds;
+
+static bool pwriteInt(const std::string& path, int value) {
+    char buf[16];
+    const auto res = std::to_chars(buf, buf + sizeof(buf), value);
+    const size_t len = static_cast<size_t>(res.ptr - buf);
+
+    std::lock_guard<std::mutex> lk(s_writeFdMtx);
+    for (int attempt = 0; attempt < 2; ++attempt) {
+        int fd = -1;
+        bool cached = false;
+        if (attempt == 0) {
+            auto it = s_writeFds.find(path);
+            if (it != s_writeFds.end()) { fd = it->second; cached = true; }
+        }
+        if (!cached) {
+            fd = ::open(path.c_str(), O_WRONLY | O_CLOEXEC);
+            if (fd < 0) return false;
+            s_writeFds[path] = fd;
+        }
+
+        if (::pwrite(fd, buf, len, 0) == static_cast<ssize_t>(len)) return true;
+
+        const int err = errno;
+        s_writeFds.erase(path);
+        ::close(fd);
+        errno = err;
+        if (!cached) break;
+    }
+    return false;
 }
 
 /* ------------------------------ helpers ----------------------------------- */
@@ -108,45 +192,73 @@ std::string Hwmon::chipVendorForName(const std::string& chipName) {
 
 /* ------------------------------ scanners ---------------------------------- */
 
-static void scanTemps(const fs::path& base, const std::string& chipPath, std::vector<HwmonTemp>& out) {
-    for (int i = 1; i <= 20; ++i) {
-        fs::path in  = base / ("temp" + std::to_string(i) + "_input");
-        if (!fileExists(in)) continue;
-        fs::path lbl = base / ("temp" + std::to_string(i) + "_label");
+// Attribute names of one hwmonX directory, collected with a single directory
+// pass instead of probing every possible tempN/fanN/pwmN name with stat().
+struct ChipAttrs {
+    std::unordered_set<std::string> names;
+    std::set<int> temps; // N of tempN_input
+    std::set<int> fans;  // N of fanN_input
+    std::set<int> pwms;  // N of pwmN
+};
+
+// "<prefix><N><suffix>" -> N, or 0 if the name does not have that shape
+static int attrIndex(std::string_view name, std::string_view prefix, std::string_view suffix) {
+    if (name.size() <= prefix.size() + suffix.size()) return 0;
+    if (name.substr(0, prefix.size()) != prefix) return 0;
+    if (name.substr(name.size() - suffix.size()) != suffix) return 0;
+    int v = 0;
+    for (char c : name.substr(prefix.size(), name.size() - prefix.size() - suffix.size())) {
+        if (c < '0' || c > '9' || v > 9999) return 0;
+        v = v * 10 + (c - '0');
+    }
+    return v;
+}
+
+static ChipAttrs listAttrs(const fs::path& base) {
+    ChipAttrs a;
+    std::error_code ec;
+    for (const auto& e : fs::directory_iterator(base, ec)) {
+        std::string n = e.path().filename().string();
+        if (int i = attrIndex(n, "temp", "_input"); i >= 1 && i <= 20) a.temps.insert(i);
+        else if (int j = attrIndex(n, "fan", "_input"); j >= 1 && j <= 10) a.fans.insert(j);
+        else if (int k = attrIndex(n, "pwm", ""); k >= 1 && k <= 10) a.pwms.insert(k);
+        a.names.insert(std::move(n));
+    }
+    return a;
+}
+
+static void scanTemps(const fs::path& base, const std::string& chipPath, const ChipAttrs& a, std::vector<HwmonTemp>& out) {
+    for (int i : a.temps) {
+        const std::string lbl = "temp" + std::to_string(i) + "_label";
         HwmonTemp t{};
         t.chipPath   = chipPath;
-        t.path_input = in.string();
-        t.label      = fileExists(lbl) ? readFirstLine(lbl) : std::string();
+        t.path_input = (base / ("temp" + std::to_string(i) + "_input")).string();
+        t.label      = a.names.count(lbl) ? readFirstLine(base / lbl) : std::string();
         out.push_back(std::move(t));
     }
 }
 
-static void scanFans(const fs::path& base, const std::string& chipPath, std::vector<HwmonFan>& out) {
-    for (int i = 1; i <= 10; ++i) {
-        fs::path in  = base / ("fan" + std::to_string(i) + "_input");
-        if (!fileExists(in)) continue;
-        fs::path lbl = base / ("fan" + std::to_string(i) + "_label");
+static void scanFans(const fs::path& base, const std::string& chipPath, const ChipAttrs& a, std::vector<HwmonFan>& out) {
+    for (int i : a.fans) {
+        const std::string lbl = "fan" + std::to_string(i) + "_label";
         HwmonFan f{};
         f.chipPath   = chipPath;
-        f.path_input = in.string();
-        f.label      = fileExists(lbl) ? readFirstLine(lbl) : std::string();
+        f.path_input = (base / ("fan" + std::to_string(i) + "_input")).string();
+        f.label      = a.names.count(lbl) ? readFirstLine(base / lbl) : std::string();
         out.push_back(std::move(f));
     }
 }
 
-static void scanPwms(const fs::path& base, const std::string& chipPath, std::vector<HwmonPwm>& out) {
-    for (int i = 1; i <= 10; ++i) {
-        fs::path p    = base / ("pwm" + std::to_string(i));
-        if (!fileExists(p)) continue;
-
-        fs::path pen  = base / ("pwm" + std::to_string(i) + "_enable");
-        fs::path pmax = base / ("pwm" + std::to_string(i) + "_max");
+static void scanPwms(const fs::path& base, const std::string& chipPath, const ChipAttrs& a, std::vector<HwmonPwm>& out) {
+    for (int i : a.pwms) {
+        const std::string pen  = "pwm" + std::to_string(i) + "_enable";
+        const std::string pmax = "pwm" + std::to_string(i) + "_max";
 
         HwmonPwm w{};
         w.chipPath    = chipPath;
-        w.path_pwm    = p.string();
-        w.path_enable = fileExists(pen) ? pen.string() : std::string();
-        w.pwm_max     = readInt(pmax).value_or(255);
+        w.path_pwm    = (base / ("pwm" + std::to_string(i))).string();
+        w.path_enable = a.names.count(pen) ? (base / pen).string() : std::string();
+        w.pwm_max     = a.names.count(pmax) ? readInt(base / pmax).value_or(255) : 255;
 
         LOG_DEBUG("Hwmon: pwm found chip=%s path=%s enable=%s max=%d",
                   w.chipPath.c_str(), w.path_pwm.c_str(),
@@ -189,9 +301,10 @@ HwmonInventory Hwmon::scan() {
         inv.chips.push_back(chip);
 
         const std::string chipPath = chip.hwmonPath; // for child entries
-        scanTemps(base, chipPath, inv.temps);
-        scanFans(base, chipPath, inv.fans);
-        scanPwms(base, chipPath, inv.pwms);
+        const ChipAttrs attrs = listAttrs(base);
+        scanTemps(base, chipPath, attrs, inv.temps);
+        scanFans(base, chipPath, attrs, inv.fans);
+        scanPwms(base, chipPath, attrs, inv.pwms);
     }
 
     LOG_INFO("Hwmon: scan complete (chips=%zu temps=%zu fans=%zu pwms=%zu)",
@@ -210,23 +323,23 @@ void Hwmon::refreshValues(HwmonInventory& inv) {
 /* ------------------------------ read helpers ------------------------------ */
 
 std::optional<double> Hwmon::readTempC(const HwmonTemp& t) {
-    auto mv = readLong(t.path_input);
+    auto mv = preadLong(t.path_input);
     if (!mv) return std::nullopt;
     // hwmon temps are millidegree Celsius
     return static_cast<double>(*mv) / 1000.0;
 }
 
 std::optional<int> Hwmon::readRpm(const HwmonFan& f) {
-    return readInt(f.path_input);
+    return preadInt(f.path_input);
 }
 
 std::optional<int> Hwmon::readEnable(const HwmonPwm& p) {
     if (p.path_enable.empty()) return std::nullopt; // unknown
-    return readInt(p.path_enable);
+    return preadInt(p.path_enable);
 }
 
 std::optional<int> Hwmon::readRaw(const HwmonPwm& p) {
-    return readInt(p.path_pwm);
+    return preadInt(p.path_pwm);
 }
 
 /* ------------------------------ write helpers ----------------------------- */
@@ -239,7 +352,7 @@ if (p.path_enable.empty()) {
     LOG_TRACE("Hwmon: setEnable noop (no enable path) for %s", p.path_pwm.c_str());
     return true;
 }
-const bool ok = writeInt(p.path_enable, mode);
+const bool ok = pwriteInt(p.path_enable, mode);
 if (!ok) {
     LOG_WARN("Hwmon: setEnable failed path=%s errno=%d", p.path_enable.c_str(), errno);
 } else {
@@ -249,10 +362,9 @@ return ok;
 
 }
 
-bool Hwmon::setRaw(const HwmonPwm& p, int raw) {
-    const int vmax = std::max(1, p.pwm_max);
-    const int v = std::clamp(raw, 0, vmax);
-    const bool ok = writeInt(p.path_pwm, v);
+// Write an already range-checked duty value to pwmN.
+static bool writePwmValue(const HwmonPwm& p, int v) {
+    const bool ok = pwriteInt(p.path_pwm, v);
     if (!ok) {
         LOG_WARN("Hwmon: setRaw failed path=%s errno=%d", p.path_pwm.c_str(), errno);
     } else {
@@ -261,11 +373,16 @@ bool Hwmon::setRaw(const HwmonPwm& p, int raw) {
     return ok;
 }
 
+bool Hwmon::setRaw(const HwmonPwm& p, int raw) {
+    const int vmax = std::max(1, p.pwm_max);
+    return writePwmValue(p, std::clamp(raw, 0, vmax));
+}
+
 bool Hwmon::setPercent(const HwmonPwm& p, int percent) {
     const int pc = std::clamp(percent, 0, 100);
     const int vmax = std::max(1, p.pwm_max);
-    const int v  = static_cast<int>(std::lround((pc / 100.0) * vmax));
-    return setRaw(p, v);
+    // round(pc * vmax / 100) in integer math; result is already within [0, vmax]
+    return writePwmValue(p, (pc * vmax + 50) / 100);
 }
 
 } // namespace lfc
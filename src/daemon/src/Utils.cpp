@@ -222,16 +222,21 @@ static inline std::string stripCommentsAndTrailingCommas_(const std::string& in)
     // This is a heuristic best-effort sanitizer for common FanControl exports.
     // It removes // line comments, /* block comments */, and trailing commas
     // before '}' or ']'. It is NOT a full JSON5 parser and intentionally simple.
+    // Patterns are compiled once; std::regex construction dominates otherwise.
+    static const std::regex re_block(R"(/\*.*?\*/)", std::regex::extended | std::regex::icase);
+    static const std::regex re_line(R"(//[^\n\r]*)");
+    static const std::regex re_trailing_comma(R"(,\s*([}\]]))");
+
     std::string s = in;
 
     // Remove /* ... */ (non-greedy)
-    s = std::regex_replace(s, std::regex(R"(/\*.*?\*/)", std::regex::extended | std::regex::icase), "");
+    s = std::regex_replace(s, re_block, "");
 
     // Remove // ... (till end of line)
-    s = std::regex_replace(s, std::regex(R"(//[^\n\r]*)"), "");
+    s = std::regex_replace(s, re_line, "");
 
     // Remove trailing commas: ,   }
-    s = std::regex_replace(s, std::regex(R"(,\s*([}\]]))"), "$1");
+    s = std::regex_replace(s, re_trailing_comma, "$1");
 
     return s;
 }
@@ -6,7 +6,9 @@
 #pragma once
 
 #include <atomic>
+#include <condition_variable>
 #include <functional>
+#include <mutex>
 #include <string>
 #include <vector>
 
@@ -19,7 +21,6 @@ namespace lfc {
 struct DetectionConfig {
     int settleMs{250};
     int spinupCheckMs{5000};
-    int spinupPollMs{100};
     int measureTotalMs{10000};
     int rpmDeltaThresh{30};
     int rampStartPercent{30};
@@ -62,7 +63,13 @@ public:
 
     bool runAutoDetect(const HwmonSnapshot& hw, DetectResult& result);
 
-    void requestStop() noexcept { stop_.store(true, std::memory_order_relaxed); }
+    void requestStop() noexcept {
+        {
+            std::lock_guard<std::mutex> lk(stopMtx_);
+            stop_.store(true, std::memory_order_relaxed);
+        }
+        stopCv_.notify_all();
+    }
 
 private:
     void report_(int pct, DetectStage st, const std::string& msg);
@@ -70,18 +77,21 @@ private:
     bool ensureManualMode_(const HwmonPwm& p);
     bool restoreMode_(const HwmonPwm& p, int prevMode, int prevRaw);
 
+    // Both expect the PWM already in manual mode; runAutoDetect() owns snapshot/restore.
     bool spinupCheck_(const HwmonPwm& p, bool& ok);
     bool measureCurve_(const HwmonPwm& p,
                        const std::vector<std::string>& tempPaths,
                        std::vector<CurvePoint>& out);
 
     static int  readRpmSafe_(const HwmonFan& f, int fallback = -1);
-    static bool sleepMsCancelable_(int ms, const std::atomic<bool>& stopFlag);
+    bool sleepMsCancelable_(int ms);
 
 private:
     DetectionConfig  cfg_;
     DetectProgressFn progress_;
     std::atomic<bool> stop_{false};
+    std::mutex stopMtx_;
+    std::condition_variable stopCv_;
 };
 
 } // namespace lfc
@@ -33,11 +33,20 @@ private:
         double lastTempC{0.0};
         double prevTempC{0.0};
         int    lastPercent{-1};
+        std::chrono::steady_clock::time_point lastWrite{};
         std::chrono::steady_clock::time_point spinUntil{};
     };
 
-    const HwmonTemp* findTempSensor(const std::string& path) const;
-    const HwmonPwm*  findPwm(const std::string& path) const;
+    // Per-control references into pwms_/temps_/profile_, resolved once in
+    // rebuildBindings() whenever the hwmon view or the profile changes.
+    struct ControlBinding {
+        const HwmonPwm*               pwm{nullptr};
+        const FanCurveMeta*           curve{nullptr};
+        std::vector<const HwmonTemp*> temps;
+        std::string                   label;   // for log lines (nickName > name > pwm path)
+    };
+
+    void rebuildBindings();
 
     int  curvePercent(const FanCurveMeta& curve, double tempC) const;
     int  applyHysteresis(RuleState& st, int target);
@@ -51,6 +60,7 @@ private:
     Profile profile_;
 
     std::vector<RuleState> ruleState_;
+    std::vector<ControlBinding> bindings_;
 };
 
 } // namespace lfc
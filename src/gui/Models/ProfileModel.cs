@@ -1,3 +1,4 @@
+using System.Text.Json;
 using System.Text.Json.Nodes;
 
 public class ProfileModel
@@ -44,4 +45,24 @@ public class ProfileModel
             ["triggers"] = new JsonArray(Triggers.ToArray())
         };
     }
+
+    // Streams the same shape as ToJson() without building an intermediate tree
+    public void WriteTo(Utf8JsonWriter writer)
+    {
+        writer.WriteStartObject();
+        writer.WriteString("name", Name);
+        WriteArray(writer, "fans", Fans);
+        WriteArray(writer, "sensors", Sensors);
+        WriteArray(writer, "mix", Mixes);
+        WriteArray(writer, "triggers", Triggers);
+        writer.WriteEndObject();
+    }
+
+    private static void WriteArray(Utf8JsonWriter writer, string name, List<JsonNode> nodes)
+    {
+        writer.WriteStartArray(name);
+        foreach (var node in nodes)
+            node.WriteTo(writer);
+        writer.WriteEndArray();
+    }
 }
@@ -36,8 +36,6 @@ public class EngineControl : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
@@ -49,8 +49,6 @@ public class ChannelEditor : Box
         }
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
@@ -1,14 +1,27 @@
 using System.Text.Json;
+using System.Text.Json.Nodes;
 
 public static class ConfigSaver
 {
+    private static readonly JsonWriterOptions Indented = new()
+    {
+        Indented = true
+    };
+
     public static void Save(string path, JsonNode data)
     {
-        var json = data.ToJsonString(new JsonSerializerOptions
-        {
-            WriteIndented = true
-        });
+        Save(path, writer => data.WriteTo(writer));
+    }
 
-        File.WriteAllText(path, json);
+    public static void Save(string path, Action<Utf8JsonWriter> write)
+    {
+        // Write next to the target and swap it in, so a crash never leaves a truncated file
+        var tmp = path + ".tmp";
+        using (var stream = File.Create(tmp))
+        using (var writer = new Utf8JsonWriter(stream, Indented))
+        {
+            write(writer);
+        }
+        File.Move(tmp, path, true);
     }
 }
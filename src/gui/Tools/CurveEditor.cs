@@ -45,8 +45,6 @@ public class CurveEditor : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
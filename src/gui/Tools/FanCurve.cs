@@ -2,43 +2,55 @@ public class FanCurve
 {
     private readonly SortedDictionary<float, float> _points = new();
 
+    // Sorted snapshot of _points for Evaluate; rebuilt only after a mutation.
+    private float[] _temps = [];
+    private float[] _percents = [];
+    private bool _dirty = true;
+
     public void AddPoint(float temperature, float percent)
     {
         _points[temperature] = percent;
+        _dirty = true;
     }
 
     public void RemovePoint(float temperature)
     {
-        _points.Remove(temperature);
+        if (_points.Remove(temperature))
+            _dirty = true;
     }
 
     public float Evaluate(float temperature)
     {
         if (_points.Count == 0) return 0;
 
-        var keys = _points.Keys.ToList();
+        if (_dirty)
+        {
+            _temps = _points.Keys.ToArray();
+            _percents = _points.Values.ToArray();
+            _dirty = false;
+        }
+
+        var keys = _temps;
+        var values = _percents;
+
+        if (float.IsNaN(temperature))
+            return 0;
 
         if (temperature <= keys[0])
-            return _points[keys[0]];
+            return values[0];
 
         if (temperature >= keys[^1])
-            return _points[keys[^1]];
+            return values[^1];
 
-        for (int i = 0; i < keys.Count - 1; i++)
-        {
-            var t1 = keys[i];
-            var t2 = keys[i + 1];
-
-            if (temperature >= t1 && temperature <= t2)
-            {
-                var p1 = _points[t1];
-                var p2 = _points[t2];
-                var ratio = (temperature - t1) / (t2 - t1);
-                return p1 + ratio * (p2 - p1);
-            }
-        }
+        // Strictly inside (first, last): exact hit or ~index of the next larger key
+        int idx = Array.BinarySearch(keys, temperature);
+        if (idx >= 0)
+            return values[idx];
 
-        return 0;
+        int hi = ~idx;
+        int lo = hi - 1;
+        var ratio = (temperature - keys[lo]) / (keys[hi] - keys[lo]);
+        return values[lo] + ratio * (values[hi] - values[lo]);
     }
 
     public IReadOnlyDictionary<float, float> Points => _points;
@@ -16,13 +16,12 @@ public class FanLogic
 
     public float Evaluate(Dictionary<string, float> sensorValues)
     {
-        var input = Mix.Evaluate(sensorValues);
-
+        // Only curve/trigger modes consume the mixed sensor input
         return Mode switch
         {
             FanMode.Manual => ManualPercent,
-            FanMode.Curve => Curve?.Evaluate(input) ?? 0,
-            FanMode.Trigger => Trigger?.Evaluate(input) ?? 0,
+            FanMode.Curve => Curve?.Evaluate(Mix.Evaluate(sensorValues)) ?? 0,
+            FanMode.Trigger => Trigger?.Evaluate(Mix.Evaluate(sensorValues)) ?? 0,
             _ => 0
         };
     }
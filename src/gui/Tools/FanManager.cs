@@ -1,18 +1,27 @@
 public class FanManager
 {
     private readonly Dictionary<string, FanLogic> _fans = new();
+    private readonly Dictionary<string, int> _lastApplied = new();
 
     public void Register(FanLogic logic)
     {
         _fans[logic.FanId] = logic;
+        _lastApplied.Remove(logic.FanId);
     }
 
     public void Update(Dictionary<string, float> sensorValues, Action<string, float> apply)
     {
         foreach (var fan in _fans.Values)
         {
-            var percent = fan.Evaluate(sensorValues);
+            // Evaluate every tick (triggers are stateful), but only push whole-percent changes
+            var percent = (int)MathF.Round(fan.Evaluate(sensorValues));
+            if (_lastApplied.TryGetValue(fan.FanId, out var last) && last == percent)
+                continue;
+
+            // Remember the value only once it was actually applied; a throwing
+            // apply must not suppress the retry on the next tick
             apply(fan.FanId, percent);
+            _lastApplied[fan.FanId] = percent;
         }
     }
 
@@ -49,15 +49,9 @@ public static class ProfileLoader
 
     public static void Save(ProfileModel model)
     {
-        var node = model.ToJson();
-        var json = node.ToJsonString(new JsonSerializerOptions
-        {
-            WriteIndented = true
-        });
-
         Directory.CreateDirectory(ProfileDir);
         var path = Path.Combine(ProfileDir, $"{model.Name}.json");
-        File.WriteAllText(path, json);
+        ConfigSaver.Save(path, model.WriteTo);
     }
 
     public static void Delete(string name)
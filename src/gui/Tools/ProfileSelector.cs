@@ -40,8 +40,6 @@ public class ProfileSelector : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
@@ -67,9 +67,7 @@ public class RuleEditor : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 
     public void LoadChannels(JsonNode? data)
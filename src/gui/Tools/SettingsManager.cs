@@ -21,6 +21,8 @@ public static class SettingsManager
 
     public static void Set(string key, string value)
     {
+        // Re-selecting the current value (e.g. combo init) must not rewrite the file
+        if (_settings[key]?.ToString() == value) return;
         _settings[key] = value;
         Save();
     }
@@ -42,13 +44,8 @@ public static class SettingsManager
 
     public static void Save()
     {
-        var json = _settings.ToJsonString(new JsonSerializerOptions
-        {
-            WriteIndented = true
-        });
-
         Directory.CreateDirectory(Path.GetDirectoryName(SettingsPath)!);
-        File.WriteAllText(SettingsPath, json);
+        ConfigSaver.Save(SettingsPath, _settings);
     }
 
     public static IReadOnlyDictionary<string, string> All =>
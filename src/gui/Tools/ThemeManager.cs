@@ -1,3 +1,4 @@
+using Gtk;
 using System.Text.Json.Nodes;
 
 public static class ThemeManager
@@ -7,6 +8,9 @@ public static class ThemeManager
     public static string TextColor       { get; private set; } = "#FFFFFF";
     public static string AccentColor     { get; private set; } = "#FFAA00";
 
+    // One provider per distinct stylesheet; views sharing the same CSS reuse it
+    private static readonly Dictionary<string, CssProvider> Providers = new();
+
     public static void Load(string themeName)
     {
         var path = Path.Combine(AppContext.BaseDirectory, "Themes", $"{themeName}.json");
@@ -22,4 +26,15 @@ public static class ThemeManager
         TextColor       = node?["text"]?.ToString()       ?? TextColor;
         AccentColor     = node?["accent"]?.ToString()     ?? AccentColor;
     }
+
+    public static void AddCss(string css)
+    {
+        if (Providers.ContainsKey(css))
+            return;
+
+        var provider = new CssProvider();
+        provider.LoadFromData(css);
+        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        Providers[css] = provider;
+    }
 }
@@ -7,6 +7,11 @@ public class FanGrid : Box
 {
     private readonly ShmReader _reader;
     private readonly Grid _grid;
+    private readonly List<Label[]> _rows = new();
+    private readonly List<string[]> _shown = new();
+    private readonly List<(string, int, string)> _parsed = new();
+    private readonly Dictionary<int, string> _rpmText = new();
+    private byte[] _lastData = Array.Empty<byte>();
 
     public FanGrid() : base(Orientation.Vertical, 6)
     {
@@ -32,14 +37,23 @@ public class FanGrid : Box
         var data = _reader.ReadSpan();
         if (data.IsEmpty) return;
 
+        // Fan block unchanged since the last tick -> labels are already current
+        var block = data.Slice(32768);
+        if (block.SequenceEqual(_lastData)) return;
+        if (_lastData.Length != block.Length) _lastData = new byte[block.Length];
+        block.CopyTo(_lastData);
+
         var fans = ParseFans(data);
         Render(fans);
     }
 
     private List<(string label, int rpm, string mode)> ParseFans(Span<byte> data)
     {
-        var result = new List<(string, int, string)>();
         int offset = 32768;
+        // 64-byte records; one list reused across ticks (capacity is kept by Clear)
+        var result = _parsed;
+        result.Clear();
+        result.EnsureCapacity(Math.Max(0, (data.Length - offset) / 64));
 
         while (offset + 64 <= data.Length)
         {
@@ -56,27 +70,63 @@ public class FanGrid : Box
 
     private void Render(List<(string label, int rpm, string mode)> fans)
     {
-        _grid.RemoveAll();
-
-        int row = 0;
-        foreach (var (label, rpm, mode) in fans)
+        // Keep row labels across ticks; only add/remove rows when the count changes
+        while (_rows.Count > fans.Count)
         {
-            var l1 = new Label(label);
-            var l2 = new Label($"{rpm} RPM");
-            var l3 = new Label(mode);
+            foreach (var cell in _rows[^1])
+                _grid.Remove(cell);
+            _rows.RemoveAt(_rows.Count - 1);
+            _shown.RemoveAt(_shown.Count - 1);
+        }
 
-            l1.SetCssClass("tile");
-            l2.SetCssClass("tile");
-            l3.SetCssClass("tile");
+        bool added = false;
 
-            _grid.Attach(l1, 0, row, 1, 1);
-            _grid.Attach(l2, 1, row, 1, 1);
-            _grid.Attach(l3, 2, row, 1, 1);
+        while (_rows.Count < fans.Count)
+        {
+            int row = _rows.Count;
+            var cells = new[] { new Label(""), new Label(""), new Label("") };
+            for (int col = 0; col < cells.Length; col++)
+            {
+                cells[col].SetCssClass("tile");
+                _grid.Attach(cells[col], col, row, 1, 1);
+            }
+            _rows.Add(cells);
+            _shown.Add(new string[cells.Length]);
+            added = true;
+        }
 
-            row++;
+        for (int i = 0; i < fans.Count; i++)
+        {
+            var (label, rpm, mode) = fans[i];
+            SetCell(i, 0, label);
+            SetCell(i, 1, FormatRpm(rpm));
+            SetCell(i, 2, mode);
         }
 
-        _grid.ShowAll();
+        if (added)
+            _grid.ShowAll();
+    }
+
+    // Tach readings cycle through a small set of values; format each once
+    private string FormatRpm(int rpm)
+    {
+        if (_rpmText.TryGetValue(rpm, out var text))
+            return text;
+
+        if (_rpmText.Count >= 256)
+            _rpmText.Clear();
+
+        text = $"{rpm} RPM";
+        _rpmText[rpm] = text;
+        return text;
+    }
+
+    // Touch the label only when its text actually changes (no relayout for steady values)
+    private void SetCell(int row, int col, string text)
+    {
+        if (_shown[row][col] == text) return;
+        _shown[row][col] = text;
+        _rows[row][col].Text = text;
     }
 
     private void ApplyTheme()
@@ -90,8 +140,6 @@ public class FanGrid : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
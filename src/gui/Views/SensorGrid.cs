@@ -7,6 +7,11 @@ public class SensorGrid : Box
 {
     private readonly ShmReader _reader;
     private readonly Grid _grid;
+    private readonly List<Label[]> _rows = new();
+    private readonly List<string[]> _shown = new();
+    private readonly List<(string, float, string)> _parsed = new();
+    private readonly Dictionary<int, string> _tempText = new();
+    private byte[] _lastData = Array.Empty<byte>();
 
     public SensorGrid() : base(Orientation.Vertical, 6)
     {
@@ -32,13 +37,21 @@ public class SensorGrid : Box
         var data = _reader.ReadSpan();
         if (data.IsEmpty) return;
 
+        // Telemetry unchanged since the last tick -> labels are already current
+        if (data.SequenceEqual(_lastData)) return;
+        if (_lastData.Length != data.Length) _lastData = new byte[data.Length];
+        data.CopyTo(_lastData);
+
         var sensors = ParseSensors(data);
         Render(sensors);
     }
 
     private List<(string label, float value, string source)> ParseSensors(Span<byte> data)
     {
-        var result = new List<(string, float, string)>();
+        // 64-byte records; one list reused across ticks (capacity is kept by Clear)
+        var result = _parsed;
+        result.Clear();
+        result.EnsureCapacity(data.Length / 64);
         int offset = 0;
 
         while (offset + 64 <= data.Length)
@@ -56,27 +69,66 @@ public class SensorGrid : Box
 
     private void Render(List<(string label, float value, string source)> sensors)
     {
-        _grid.RemoveAll();
-
-        int row = 0;
-        foreach (var (label, value, source) in sensors)
+        // Keep row labels across ticks; only add/remove rows when the count changes
+        while (_rows.Count > sensors.Count)
         {
-            var l1 = new Label(label);
-            var l2 = new Label($"{value:F1} °C");
-            var l3 = new Label(source);
+            foreach (var cell in _rows[^1])
+                _grid.Remove(cell);
+            _rows.RemoveAt(_rows.Count - 1);
+            _shown.RemoveAt(_shown.Count - 1);
+        }
 
-            l1.SetCssClass("tile");
-            l2.SetCssClass("tile");
-            l3.SetCssClass("tile");
+        bool added = false;
 
-            _grid.Attach(l1, 0, row, 1, 1);
-            _grid.Attach(l2, 1, row, 1, 1);
-            _grid.Attach(l3, 2, row, 1, 1);
+        while (_rows.Count < sensors.Count)
+        {
+            int row = _rows.Count;
+            var cells = new[] { new Label(""), new Label(""), new Label("") };
+            for (int col = 0; col < cells.Length; col++)
+            {
+                cells[col].SetCssClass("tile");
+                _grid.Attach(cells[col], col, row, 1, 1);
+            }
+            _rows.Add(cells);
+            _shown.Add(new string[cells.Length]);
+            added = true;
+        }
 
-            row++;
+        for (int i = 0; i < sensors.Count; i++)
+        {
+            var (label, value, source) = sensors[i];
+            SetCell(i, 0, label);
+            SetCell(i, 1, FormatTemp(value));
+            SetCell(i, 2, source);
         }
 
-        _grid.ShowAll();
+        if (added)
+            _grid.ShowAll();
+    }
+
+    // Sensors report whole millidegrees, so the same float readings recur. Key on the
+    // exact bit pattern (distinguishes -0.0, no rounding) and format the reading itself
+    // with F1, so the text is identical to formatting it every tick.
+    private string FormatTemp(float value)
+    {
+        int key = BitConverter.SingleToInt32Bits(value);
+        if (_tempText.TryGetValue(key, out var text))
+            return text;
+
+        if (_tempText.Count >= 256)
+            _tempText.Clear();
+
+        text = $"{value:F1} °C";
+        _tempText[key] = text;
+        return text;
+    }
+
+    // Touch the label only when its text actually changes (no relayout for steady values)
+    private void SetCell(int row, int col, string text)
+    {
+        if (_shown[row][col] == text) return;
+        _shown[row][col] = text;
+        _rows[row][col].Text = text;
     }
 
     private void ApplyTheme()
@@ -90,8 +142,6 @@ public class SensorGrid : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }
@@ -15,6 +15,7 @@ public class StatusBar : Box
 
     public void SetText(string text)
     {
+        if (_label.Text == text) return;
         _label.Text = text;
     }
 
@@ -29,8 +30,6 @@ public class StatusBar : Box
         }}
         ";
 
-        var provider = new CssProvider();
-        provider.LoadFromData(css);
-        StyleContext.AddProviderForDisplay(Display.Default, provider, 800);
+        ThemeManager.AddCss(css);
     }
 }